@@ -1,5 +1,3 @@
-import time
-
 from reglo_icc_pump import RegloIccPump
 
 
@@ -16,7 +14,6 @@ try:
     print("  Okay!")
 except RegloIccPump.SerialNoMismatch as e:
     print(f"  {e!r}")
-    time.sleep(0.2)
 
 print()
 p = RegloIccPump.open_first_device(
@@ -31,9 +28,10 @@ print(f"Channel numbers:  {p.channel_nos!r}")
 
 p.show_msg("Concurrent")
 print("\nConcurrent pumping operations...")
-for ch_no in p.channel_nos:
-    p.aspirate_vol(ch_no, 5.0e-3, 0.5, blocking=False)
-p.wait_for_stop()
+p.pump_multi({
+    ch_no: (p.dispense_dirs[ch_no].opposite(), 5.0e-3, 0.5)
+    for ch_no in p.channel_nos
+    })
 
 p.show_msg("Sequential")
 print("\nSequential pumping operations...")
@@ -1,4 +1,5 @@
 from ._driver import RegloIccPump
+from .group import PumpGroup
 
 
-__all__ = ["RegloIccPump"]
+__all__ = ["RegloIccPump", "PumpGroup"]
@@ -1,9 +1,12 @@
-from enum import Enum
+from concurrent import futures
 import math
+import os
+import select
+import threading
 import time
 from typing import (
-    Any, Callable, Dict, Iterable, List, Literal, Optional, TextIO, Tuple,
-    Union)
+    Any, Callable, Dict, FrozenSet, List, Literal, Optional, Sequence,
+    TextIO, Tuple, Union)
 
 import serial
 import serial.tools.list_ports
@@ -18,6 +21,18 @@ class RegloIccPump:
     BAUDRATE = 9600
     CMD_TIMEOUT_S = 2.
 
+    #: Initial/maximum interval between status polls while waiting for a
+    #: channel to stop -- see :meth:`wait_for_stop`
+    POLL_INTERVAL_MIN_S = 0.05
+    POLL_INTERVAL_MAX_S = 0.2
+
+    #: Minimum interval between odometer reads for stall detection; with a
+    #: 2 s stall window, sampling more often can't change the outcome
+    ODO_POLL_INTERVAL_S = 0.5
+
+    _VALID_RESPS = frozenset(b"*#-+")
+    _SUCCESS_RESP = ord("*")
+
     RegloIccPumpError = types.RegloIccPumpError
     DeviceNotFound = types.DeviceNotFound
     SerialNoMismatch = types.SerialNoMismatch
@@ -31,20 +46,53 @@ class RegloIccPump:
     PumpDirection = types.PumpDirection
 
     DEFAULT_DISPENSE_DIR = PumpDirection.CW
+    _DIR_CMD = {
+        PumpDirection.CW: "J",
+        PumpDirection.CCW: "K",
+        }
     USB_HW_IDS = {
         (0x265C, 0x0001),
         }
 
-    dispense_dirs: Dict[int, _PumpDirectionOrLiteral]
+    #: Per-channel "dispense" rotation directions; values are always
+    #: normalized to :class:`PumpDirection` members
+    dispense_dirs: Dict[int, types.PumpDirection]
     _pump_addr: int
-    _channel_nos: List[int]
-    _pump_serial_no: str
-    _pump_model_no: str
-    _pump_sw_ver: str
-    _pump_head_code: str
+    _channel_nos: Tuple[int, ...]
+    _channel_no_set: FrozenSet[int]
+    _pump_serial_no: Optional[str]
+    _pump_model_no: Optional[str]
+    _pump_sw_ver: Optional[str]
+    _pump_head_code: Optional[str]
     _max_flow_rate: dict[int, float | None]
+    _is_running_cmds: Dict[int, bytes]
+    _stop_cmds: Dict[int, bytes]
+    _odo_cmds: Dict[int, bytes]
     _last_odo_val: dict[int, int]
     _last_odo_val_tstamp: dict[int, float]
+    _last_odo_read_tstamp: dict[int, float]
+    _eta: Dict[int, float]
+    _known_idle: set[int]
+    _ser_fd: Optional[int]
+    _acks_owed: int
+    _rx_resettable: bool
+    _rx_chunked: bool
+    _rx_excess: bytearray
+    _tx_buf: bytearray
+    _io_lock: threading.RLock
+    _wait_executor: Optional[futures.ThreadPoolExecutor]
+
+    __slots__ = (
+        'ser_port', 'dispense_dirs', 'tubing_ids', '_pump_addr',
+        '_channel_nos', '_channel_no_set', '_pump_serial_no',
+        '_pump_model_no', '_pump_sw_ver', '_pump_head_code',
+        '_max_flow_rate', '_is_running_cmds', '_stop_cmds', '_odo_cmds',
+        '_last_odo_val',
+        '_last_odo_val_tstamp', '_last_odo_read_tstamp', '_eta',
+        '_known_idle', '_ser_fd',
+        '_acks_owed', '_rx_resettable', '_rx_chunked', '_rx_excess',
+        '_tx_buf', '_io_lock', '_wait_executor',
+        )
 
     def __init__(
             self,
@@ -54,6 +102,7 @@ class RegloIccPump:
                 Dict[int, _PumpDirectionOrLiteral]] = None,
             tubing_ids: Optional[Dict[int, float]] = None,
             serial_no: Optional[str] = None,
+            low_latency: bool = True,
             ):
         """
         Initialize a driver instance using the specified serial port and
@@ -61,7 +110,9 @@ class RegloIccPump:
 
         :param ser_port: `serial.Serial` instance (or something with a
             compatible interface) to use for communications. Note that the
-            `timeout` and `baudrate` attributes will be re-set if they exist.
+            `timeout` and `baudrate` attributes will be re-set if they exist,
+            and low-latency mode will be enabled on the port if supported
+            (see ``low_latency``).
         :param pump_addr: Pump address. If not daisy-chaining, usually this
             should be left as default. Pumps are supposed to ship with the
             address set to 1.
@@ -74,6 +125,12 @@ class RegloIccPump:
         :param serial_no: If not ``None``, this will be checked against the
             serial number reported by the pump and :class:`SerialNoMismatch`
             will be raised in case of a mismatch.
+        :param low_latency: If ``True`` (the default), try to enable
+            low-latency mode on the serial port. This drops the latency timer
+            of common USB-serial bridge chips (e.g. FTDI) from ~16 ms to
+            1 ms, which substantially speeds up the many small
+            request/response exchanges this driver performs. Silently ignored
+            on platforms or ports that don't support it.
 
         :raises SerialNoMismatch: if the serial number reported by the pump
             doesn't match the one (optionally) specified
@@ -85,15 +142,75 @@ class RegloIccPump:
             self.ser_port.timeout = self.CMD_TIMEOUT_S
         if hasattr(ser_port, 'baudrate'):
             self.ser_port.baudrate = self.BAUDRATE
+        if low_latency and hasattr(ser_port, 'set_low_latency_mode'):
+            try:
+                self.ser_port.set_low_latency_mode(True)
+            except (IOError, NotImplementedError, ValueError):
+                # Not supported on all platforms/adapters; non-essential
+                pass
+        try:
+            # Underlying file descriptor, for the low-overhead status poll
+            # path; not available on Windows or on port-like objects that
+            # aren't backed by a real fd
+            self._ser_fd = self.ser_port.fileno()
+        except (AttributeError, OSError, NotImplementedError):
+            self._ser_fd = None
+        self._acks_owed = 0
+        self._rx_resettable = hasattr(ser_port, 'reset_input_buffer')
+        self._rx_chunked = hasattr(ser_port, 'in_waiting')
+        self._rx_excess = bytearray()
+        self._tx_buf = bytearray()
+        # Serializes individual command/response exchanges on the port so
+        # that one instance can be safely driven from multiple threads;
+        # reentrant because exchange helpers nest (e.g. _run_cmd ->
+        # _read_cmd_resp)
+        self._io_lock = threading.RLock()
+        # Created on demand by dispense_vol_future
+        self._wait_executor = None
         self._pump_addr = pump_addr
-        self._pump_serial_no = self._ask_serial_no()
-        if serial_no is not None and self.serial_no != serial_no:
-            raise self.SerialNoMismatch(
-                f"Wrong pump serial number (expected {serial_no!r}, "
-                f"pump reported {self.serial_no!r})")
-        n_channels = self._ask_num_channels()
-        self._run_cmd(f"{self.pump_addr}~1")
-        self._channel_nos = list(range(1, n_channels+1))
+        # Metadata (serial number, model/version/head info) is fetched
+        # lazily by the corresponding properties; only the
+        # channel-addressing mode set and the channel count query -- which
+        # the driver itself needs -- are issued up front, batched into one
+        # write+read pass to shave round trips off the (latency-dominated)
+        # open sequence. The serial number query joins the batch when a
+        # mismatch check was requested, so that it fires early.
+        self._pump_serial_no = None
+        self._pump_model_no = self._pump_sw_ver = self._pump_head_code = None
+        ops: List[Tuple[str, Union[None, str, Sequence[Callable]]]] = [
+            (f"{self.pump_addr}~1", None),
+            (f"{self.pump_addr}xA", [int]),
+            ]
+        if serial_no is not None:
+            ops.append((f"{self.pump_addr}xS", [str]))
+        results = self._run_pipeline(ops)
+        n_channels = results[1][0]
+        if serial_no is not None:
+            self._pump_serial_no = results[2][0]
+            if self._pump_serial_no != serial_no:
+                raise self.SerialNoMismatch(
+                    f"Wrong pump serial number (expected {serial_no!r}, "
+                    f"pump reported {self._pump_serial_no!r})")
+        self._channel_nos = tuple(range(1, n_channels+1))
+        self._channel_no_set = frozenset(self._channel_nos)
+        self._eta = {}
+        # Channels known (from our own commands/polls) to not be running;
+        # lets pump_vol skip the precautionary stop command. Starts empty
+        # since a channel may still be running from a previous session.
+        self._known_idle = set()
+        # Pre-encoded per-channel commands for the polling hot path
+        self._is_running_cmds = {
+            ch_no: f"{ch_no}E{self._pump_addr}\r".encode("ascii")
+            for ch_no in self._channel_nos
+            }
+        self._stop_cmds = {
+            ch_no: f"{ch_no}I{self._pump_addr}\r".encode("ascii")
+            for ch_no in self._channel_nos
+            }
+        self._odo_cmds = {
+            ch_no: f"{ch_no}xXX{self._pump_addr}\r".encode("ascii")
+            for ch_no in self._channel_nos
+            }
         self._init_channel_odos()
         self.dispense_dirs = {
             x: self.DEFAULT_DISPENSE_DIR for x in self.channel_nos}
@@ -103,10 +220,7 @@ class RegloIccPump:
         self.tubing_ids: Dict[int, float] = {}
         self._max_flow_rate = {ch_no: None for ch_no in self._channel_nos}
         if tubing_ids is not None:
-            for ch_no, tubing_id in tubing_ids.items():
-                self.set_tubing_id(ch_no, tubing_id)
-        self._pump_model_no, self._pump_sw_ver, self._pump_head_code = \
-            self._ask_pump_info()
+            self.set_tubing_ids(tubing_ids)
 
     @classmethod
     def list_connected_devices(
@@ -234,19 +348,21 @@ class RegloIccPump:
         return self._run_query(f"{self.pump_addr}#", (str, str, str))
 
     def _assert_valid_ch_no(self, ch_no: int) -> None:
-        if ch_no not in self.channel_nos:
+        if ch_no not in self._channel_no_set:
             raise ValueError(f"Invalid channel number: {ch_no!r}")
 
     def _ask_odometer_val(self, ch_no: int) -> int:
-        return self._run_query(f"{ch_no}xXX{self.pump_addr}", (int,))[0]
+        return self._run_query(self._odo_cmds[ch_no], (int,))[0]
 
     def _init_channel_odo(self, ch_no: int):
         self._last_odo_val[ch_no] = -1
         self._last_odo_val_tstamp[ch_no] = 0.
+        self._last_odo_read_tstamp[ch_no] = 0.
 
     def _init_channel_odos(self):
         self._last_odo_val = {}
         self._last_odo_val_tstamp = {}
+        self._last_odo_read_tstamp = {}
         for ch_no in self._channel_nos:
              self._init_channel_odo(ch_no)
 
@@ -258,54 +374,169 @@ class RegloIccPump:
             "stall detection likely activated"
             )
 
-    def _send_cmd(self, cmd: str) -> None:
+    def _prepare_to_send(self) -> None:
+        # Collect any status bytes owed by fire-and-forget commands, then
+        # discard stale RX bytes (e.g. the tail of a response abandoned by
+        # a Ctrl-C'd wait) so the next response pairs with the next command
+        if self._acks_owed:
+            self._drain_owed_acks()
+        self._rx_excess.clear()
+        if self._rx_resettable:
+            self.ser_port.reset_input_buffer()
+
+    def _drain_owed_acks(self) -> None:
+        # Collect status bytes still owed by earlier fire-and-forget
+        # commands (see show_msg) before starting a new exchange, so that
+        # command/response pairing stays in sync
+        while self._acks_owed:
+            self._acks_owed -= 1
+            try:
+                self._read_cmd_resp(check_success=False, pass_resps="")
+            except self.RegloIccPumpError:
+                # The command this acknowledges was best-effort anyway
+                pass
+
+    def _send_cmd(self, cmd: Union[str, bytes]) -> None:
         #print("XXXX cmd:", cmd)
-        self.ser_port.write(cmd.encode() + b"\r")
+        self._prepare_to_send()
+        if isinstance(cmd, bytes):
+            # Pre-encoded commands are written verbatim (incl. terminator)
+            self.ser_port.write(cmd)
+        else:
+            # Assemble into a reused buffer to avoid two fresh bytes
+            # objects per command
+            self._tx_buf.clear()
+            self._tx_buf += cmd.encode("ascii")
+            self._tx_buf.append(0x0D)
+            self.ser_port.write(self._tx_buf)
+
+    def _read_line(self) -> bytes:
+        """
+        Read an ``\\r\\n``-terminated response line. Unlike
+        ``ser_port.read_until()``, which takes one syscall per byte, this
+        reads whatever has already arrived in each pass. Bytes received
+        beyond the terminator (e.g. the stray ack some firmware versions
+        append to a response) are stashed and handed to the next
+        status-byte read instead of being lost.
+        """
+        buf = bytearray(self._rx_excess)
+        self._rx_excess.clear()
+        term_idx = buf.find(b"\r\n")
+        if term_idx < 0 and not self._rx_chunked:
+            # Port can't report how much is waiting; fall back to pySerial
+            buf += self.ser_port.read_until(b"\r\n")
+            term_idx = buf.find(b"\r\n")
+            if term_idx < 0:
+                # Timed out; empty/partial line reported to caller (the
+                # chunked loop below needs in_waiting, which this port
+                # doesn't have)
+                return bytes(buf)
+        while term_idx < 0:
+            n_avail = self.ser_port.in_waiting
+            chunk = self.ser_port.read(n_avail if n_avail > 0 else 1)
+            if not chunk:
+                break  # timed out; empty/partial line reported to caller
+            search_from = max(len(buf) - 1, 0)
+            buf += chunk
+            term_idx = buf.find(b"\r\n", search_from)
+        if term_idx >= 0 and len(buf) > term_idx + 2:
+            self._rx_excess += buf[term_idx + 2:]
+            del buf[term_idx + 2:]
+        return bytes(buf)
 
     def _read_cmd_resp(self, check_success: bool, pass_resps: str) -> str:
-        resp = self.ser_port.read(1)
+        if self._rx_excess:
+            resp = bytes(self._rx_excess[:1])
+            del self._rx_excess[:1]
+        else:
+            resp = self.ser_port.read(1)
         #print("XXXX resp:", resp)
         if not resp:
             raise self.CommandTimeout()
-        if resp not in b"*#-+" + pass_resps.encode("ascii"):
+        # chr() (unlike a decode) can't fail on garbage bytes from line
+        # noise, so those still get classified as InvalidResponse below
+        resp_char = chr(resp[0])
+        if resp[0] not in self._VALID_RESPS and resp_char not in pass_resps:
             raise self.InvalidResponse()  # TODO descriptive messages for these
         if (
-                check_success and resp != b"*"
-                and resp.decode("ascii") not in pass_resps
+                check_success and resp[0] != self._SUCCESS_RESP
+                and resp_char not in pass_resps
                 ):
             raise self.RemoteError()
-        return resp.decode("ascii")
+        return resp_char
 
-    def _run_cmd(self, cmd: str, check_success: bool = True,
+    def _run_cmd(self, cmd: Union[str, bytes], check_success: bool = True,
                  pass_resps: str = "") -> str:
-        self._send_cmd(cmd)
-        return self._read_cmd_resp(
-            check_success=check_success, pass_resps=pass_resps)
-
-
-    def _run_query(self, cmd: str, field_types: Iterable[Callable]
-                   ) -> List[Any]:
-        field_types = list(field_types)
-        self._send_cmd(cmd)
-        resp = self.ser_port.read_until(b"\r\n").decode("ascii").strip()
+        with self._io_lock:
+            self._send_cmd(cmd)
+            return self._read_cmd_resp(
+                check_success=check_success, pass_resps=pass_resps)
+
+    def _run_pipeline(
+            self, ops: Sequence[Tuple[str, Union[None, str,
+                                                 Sequence[Callable]]]]
+            ) -> List[Any]:
+        """
+        Write several commands in one serial write, then collect and parse
+        all their responses in order. Each op is a tuple ``(cmd, resp_spec)``
+        where ``resp_spec`` is ``None`` for a command answered by a single
+        status byte, a string of extra pass responses for a status-byte
+        command (see :meth:`_run_cmd`), or a sequence of field types for a
+        query answered by a data line (see :meth:`_run_query`).
+
+        Note that on error the responses to any remaining commands are left
+        unread in the receive buffer.
+        """
+        with self._io_lock:
+            self._prepare_to_send()
+            self.ser_port.write(
+                b"".join(f"{cmd}\r".encode("ascii") for cmd, _ in ops))
+            results: List[Any] = []
+            for _, resp_spec in ops:
+                if resp_spec is None or isinstance(resp_spec, str):
+                    results.append(self._read_cmd_resp(
+                        check_success=True, pass_resps=resp_spec or ""))
+                else:
+                    results.append(self._read_query_resp(resp_spec))
+            return results
+
+    def _run_query(self, cmd: Union[str, bytes],
+                   field_types: Sequence[Callable]) -> List[Any]:
+        with self._io_lock:
+            self._send_cmd(cmd)
+            return self._read_query_resp(field_types)
+
+    def _read_query_resp(self, field_types: Sequence[Callable]
+                         ) -> List[Any]:
+        # Stay in bytes while stripping/splitting; only the individual
+        # fields that actually get parsed are decoded, halving the string
+        # allocations per query
+        resp = self._read_line().strip()
         #print("XXXX resp:", resp)
         if not resp:
             raise self.CommandTimeout()
-        resp_fields = resp.rsplit(None, len(field_types) - 1)
         exp_n_fields = len(field_types)
+        if exp_n_fields == 1:
+            # Fast path for the common single-field queries
+            try:
+                return [field_types[0](resp.decode("ascii"))]
+            except ValueError as e:
+                raise self.InvalidResponse(
+                    "Failed to convert value in field 0") from e
+        resp_fields = resp.rsplit(None, exp_n_fields - 1)
         got_n_fields = len(resp_fields)
         if exp_n_fields != got_n_fields:
             raise self.InvalidResponse(
                 f"Expected response with {exp_n_fields} "
                 f"data fields, got {got_n_fields}")
         return_vals = []
-        for field_idx, field_raw in enumerate(resp_fields):
+        for field_idx, (field_type, field_raw) in enumerate(
+                zip(field_types, resp_fields)):
             try:
-                conv = field_types[field_idx](field_raw)
+                return_vals.append(field_type(field_raw.decode("ascii")))
             except ValueError as e:
                 raise self.InvalidResponse(
                     f"Failed to convert value in field {field_idx}") from e
-            return_vals.append(conv)
         return return_vals
 
     def get_max_flow_rate(self, ch_no: int) -> float:
@@ -322,26 +553,34 @@ class RegloIccPump:
         :raises CommandTimeout, InvalidResponse, RemoteError:
             (see class descriptions)
         """
-        if self._max_flow_rate[ch_no] is None:
-            flow_rate, flow_unit = self._run_query(
-                f"{ch_no}?{self.pump_addr}", [float, str])
-            if flow_unit != "ml/min":
-                raise self.InvalidResponse(
-                    f"Wasn't expecting unit string {flow_unit}")
-            self._max_flow_rate[ch_no] = flow_rate
-        self._read_cmd_resp(True, "")
-        # ^ FW bug, pump sends back a "*" after the expected response
-        return self._max_flow_rate[ch_no]
-
-    def set_tubing_id(self, ch_no: int, inner_diam: float) -> float:
+        with self._io_lock:
+            if self._max_flow_rate[ch_no] is None:
+                flow_rate, flow_unit = self._run_query(
+                    f"{ch_no}?{self.pump_addr}", [float, str])
+                if flow_unit != "ml/min":
+                    raise self.InvalidResponse(
+                        f"Wasn't expecting unit string {flow_unit}")
+                self._max_flow_rate[ch_no] = flow_rate
+            self._read_cmd_resp(True, "")
+            # ^ FW bug, pump sends back a "*" after the expected response
+            return self._max_flow_rate[ch_no]
+
+    def set_tubing_id(self, ch_no: int, inner_diam: float,
+                      verify: bool = False) -> float:
         """
         Sets the inner diameter of the tubing for a given channel
 
         :param ch_no: Pump channel number
         :param inner_diam: Tubing, inner diameter, in mm. Must match one of
             the values listed in the pump documentation.
+        :param verify: If ``True``, read the stored value back from the pump
+            after setting it, at the cost of an extra query round trip. If
+            ``False`` (the default), trust the pump's acknowledgement of the
+            set command.
 
-        :returns: The value reported back by the pump, in mm
+        :returns: The value reported back by the pump (if ``verify``), in mm,
+            otherwise the requested value rounded to 0.01 mm as sent to the
+            pump
 
         :raises InvalidTubingId: if the pump rejected the given value
         :raises CommandTimeout, InvalidResponse, RemoteError:
@@ -354,11 +593,55 @@ class RegloIccPump:
         except self.RemoteError:
             raise self.InvalidTubingId(inner_diam)
         self._max_flow_rate[ch_no] = None
-        resp_val, resp_unit = self._run_query(
-            f"{ch_no}++{self.pump_addr}", [float, str])
+        if verify:
+            resp_val, resp_unit = self._run_query(
+                f"{ch_no}++{self.pump_addr}", [float, str])
+        else:
+            resp_val = round(inner_diam * 100.) / 100.
         self.tubing_ids[ch_no] = resp_val
         return resp_val
 
+    def set_tubing_ids(self, tubing_ids: Dict[int, float],
+                       verify: bool = False) -> None:
+        """
+        Sets the tubing inner diameter for several channels at once.
+
+        The set commands for all channels are written in a single batch and
+        their acknowledgements drained afterwards, so configuring N channels
+        costs roughly one round trip rather than N (or 2N with readback).
+
+        :param tubing_ids: Mapping of channel numbers to tubing inner
+            diameters in mm (see :meth:`set_tubing_id`)
+        :param verify: If ``True``, read each stored value back from the
+            pump after setting it (see :meth:`set_tubing_id`)
+
+        :raises InvalidTubingId: if the pump rejected one of the given
+            values
+        :raises CommandTimeout, InvalidResponse, RemoteError:
+            (see class descriptions)
+        """
+        for ch_no in tubing_ids:
+            self._assert_valid_ch_no(ch_no)
+        with self._io_lock:
+            self._prepare_to_send()
+            self.ser_port.write(b"".join(
+                f"{ch_no}++{self.pump_addr}{round(inner_diam * 100.):04d}\r"
+                .encode("ascii")
+                for ch_no, inner_diam in tubing_ids.items()))
+            for ch_no, inner_diam in tubing_ids.items():
+                try:
+                    self._read_cmd_resp(check_success=True, pass_resps="")
+                except self.RemoteError:
+                    # NB remaining acknowledgements are left unread
+                    raise self.InvalidTubingId(inner_diam)
+                self._max_flow_rate[ch_no] = None
+                self.tubing_ids[ch_no] = round(inner_diam * 100.) / 100.
+        if verify:
+            for ch_no in tubing_ids:
+                resp_val, resp_unit = self._run_query(
+                    f"{ch_no}++{self.pump_addr}", [float, str])
+                self.tubing_ids[ch_no] = resp_val
+
     def pump_vol(
             self,
             ch_no: int,
@@ -385,36 +668,114 @@ class RegloIccPump:
             (see class descriptions)
         """
         direction = self.PumpDirection(direction)
-        dir_cmd = "J" if direction == self.PumpDirection.CW else "K"
-        self.stop(ch_no)
-        self._run_cmd(f"{ch_no}{dir_cmd}{self.pump_addr}")  # set rotation dir
-        self._run_cmd(f"{ch_no}O{self.pump_addr}")  # set to vol/time mode
-        self._run_cmd(f"{ch_no}xff{self.pump_addr}1")  # speed from flow rate
-        self._run_query(  # set volume
-            f"{ch_no}vv{self.pump_addr}{self._format_vol_type2(vol)}", [str])
-        self._run_query(  # set flow rate
-            f"{ch_no}ff{self.pump_addr}{self._format_vol_type2(rate)}", [str])
-        # start pumping
-        resp = self._run_cmd(f"{ch_no}H{self.pump_addr}", pass_resps="-")
-        if resp == "-":
-            reason, limit_val = self._run_query(
-                f"{ch_no}xe", [str, str])
-            if reason == "R":
-                raise self.InvalidFlowRate(
-                    f"Pump reported flow rate setting ({rate:.2f} mL/min) is "
-                    f"invalid (limit: {limit_val!r})")
-            elif reason == "V":
-                raise self.InvalidParameter(
-                    f"Pump reported volume setting ({vol:.3f} mL) is "
-                    f"invalid (limit: {limit_val!r})")
-            else:
-                # We shouldn't ever see the invalid cycle count error
-                # because we don't implement cycles currently
-                raise InvalidResponse()
+        self._assert_valid_ch_no(ch_no)
+        ops = self._pump_vol_ops(ch_no, direction, vol, rate)
+        if ch_no in self._known_idle:
+            ops = ops[1:]  # elide the precautionary stop command
+        self._known_idle.discard(ch_no)
+        resps = self._run_pipeline(ops)
+        if resps[-1] == "-":
+            self._known_idle.add(ch_no)
+            self._raise_start_error(ch_no, vol, rate)
         self._init_channel_odo(ch_no)
+        self._eta[ch_no] = time.monotonic() + 60. * vol / rate
         if blocking:
             self.wait_for_stop(ch_no)
 
+    def _pump_vol_ops(
+            self, ch_no: int, direction: types.PumpDirection,
+            vol: float, rate: float
+            ) -> List[Tuple[str, Union[None, str, Sequence[Callable]]]]:
+        # The full command script to set up and start one channel's
+        # volume-at-rate operation, for use with _run_pipeline. None of the
+        # commands depend on the content (only the success) of the previous
+        # response, so the whole script can be written in one burst.
+        return [
+            (f"{ch_no}I{self.pump_addr}", None),  # stop
+            (f"{ch_no}{self._DIR_CMD[direction]}{self.pump_addr}",
+             None),  # set rotation dir
+            (f"{ch_no}O{self.pump_addr}", None),  # set to vol/time mode
+            (f"{ch_no}xff{self.pump_addr}1", None),  # speed from flow rate
+            (f"{ch_no}vv{self.pump_addr}"
+             f"{self._format_vol_type2(vol)}", [str]),  # set volume
+            (f"{ch_no}ff{self.pump_addr}"
+             f"{self._format_vol_type2(rate)}", [str]),  # set flow rate
+            (f"{ch_no}H{self.pump_addr}", "-"),  # start pumping
+            ]
+
+    def _raise_start_error(self, ch_no: int, vol: float, rate: float
+                           ) -> None:
+        # The pump answered "-" to a start command; ask it why and raise
+        # the matching exception
+        reason, limit_val = self._run_query(
+            f"{ch_no}xe", [str, str])
+        if reason == "R":
+            raise self.InvalidFlowRate(
+                f"Pump reported flow rate setting ({rate:.2f} mL/min) is "
+                f"invalid (limit: {limit_val!r})")
+        elif reason == "V":
+            raise self.InvalidVolume(
+                f"Pump reported volume setting ({vol:.3f} mL) is "
+                f"invalid (limit: {limit_val!r})")
+        else:
+            # We shouldn't ever see the invalid cycle count error
+            # because we don't implement cycles currently
+            raise self.InvalidResponse()
+
+    def pump_multi(
+            self,
+            specs: Dict[int, Tuple[_PumpDirectionOrLiteral, float, float]],
+            blocking: bool = True
+            ) -> None:
+        """
+        Commands several channels to each pump a volume of liquid, starting
+        them all (nearly) simultaneously.
+
+        The setup commands for all channels are pipelined into a single
+        serial write, so startup time is bounded by raw line rate rather
+        than paying a full command round trip per channel per command as a
+        loop over :meth:`pump_vol` would.
+
+        :param specs: Mapping of channel numbers to ``(direction, vol,
+            rate)`` tuples; the elements have the same meaning as the
+            corresponding :meth:`pump_vol` parameters
+        :param blocking: If true, only returns after all the requested
+            channels have finished pumping, otherwise returns immediately;
+            defaults to ``True``
+
+        :raises InvalidVolume: if pump rejects a requested volume
+        :raises InvalidFlowRate: if pump rejects a requested flow rate
+        :raises CommandTimeout, InvalidResponse, RemoteError:
+            (see class descriptions)
+        """
+        specs_ = {}
+        for ch_no, (direction, vol, rate) in specs.items():
+            self._assert_valid_ch_no(ch_no)
+            specs_[ch_no] = (self.PumpDirection(direction), vol, rate)
+        ops: List[Tuple[str, Union[None, str, Sequence[Callable]]]] = []
+        ch_op_counts = []
+        for ch_no, (direction, vol, rate) in specs_.items():
+            ch_ops = self._pump_vol_ops(ch_no, direction, vol, rate)
+            if ch_no in self._known_idle:
+                ch_ops = ch_ops[1:]  # elide the precautionary stop command
+            self._known_idle.discard(ch_no)
+            ops.extend(ch_ops)
+            ch_op_counts.append(len(ch_ops))
+        results = self._run_pipeline(ops)
+        resp_idx = 0
+        for (ch_no, (direction, vol, rate)), n_ops in zip(
+                specs_.items(), ch_op_counts):
+            resp_idx += n_ops
+            if results[resp_idx - 1] == "-":
+                self._known_idle.add(ch_no)
+                self._raise_start_error(ch_no, vol, rate)
+        now = time.monotonic()
+        for ch_no, (direction, vol, rate) in specs_.items():
+            self._init_channel_odo(ch_no)
+            self._eta[ch_no] = now + 60. * vol / rate
+        if blocking:
+            self._wait_for_stop_multi(list(specs_))
+
     def dispense_vol(self, ch_no: int, vol: float, rate: float,
                      *args, **kwargs) -> None:
         """
@@ -446,11 +807,61 @@ class RegloIccPump:
         self._assert_valid_ch_no(ch_no)
         self.pump_vol(
             ch_no=ch_no,
-            direction=self.PumpDirection(self.dispense_dirs[ch_no]).opposite(),
+            direction=self.dispense_dirs[ch_no].opposite(),
             vol=vol,
             rate=rate,
             **kwargs)
 
+    def dispense_vol_future(self, ch_no: int, vol: float, rate: float
+                            ) -> 'futures.Future[None]':
+        """
+        Non-blocking variant of :meth:`dispense_vol`: start the dispense,
+        then return a :class:`concurrent.futures.Future` that completes once
+        the channel has stopped.
+
+        The pump is started synchronously (so parameter errors are raised
+        directly from this call); only the completion wait -- including
+        stall-detection polling -- runs on a background thread. The caller's
+        thread is thus free to supervise other channels or pumps while the
+        run is in progress. Waiting exceptions (e.g.
+        :class:`StallDetectionDetected`) are delivered through the future's
+        ``result()``.
+
+        :param ch_no: Pump channel number
+        :param vol: Volume to pump, in ml
+        :param rate: Flow rate to pump at, in ml/min
+
+        :returns: Future that resolves (to ``None``) when pumping completes
+
+        :raises CommandTimeout, InvalidResponse, RemoteError, \
+            InvalidFlowRate, InvalidVolume: (see class descriptions)
+        """
+        self.dispense_vol(ch_no, vol, rate, blocking=False)
+        if self._wait_executor is None:
+            # One worker per channel suffices: at most one outstanding wait
+            # per channel is meaningful
+            self._wait_executor = futures.ThreadPoolExecutor(
+                max_workers=len(self._channel_nos),
+                thread_name_prefix="reglo-icc-wait")
+        return self._wait_executor.submit(self.wait_for_stop, ch_no)
+
+    def set_dispense_dir(self, ch_no: int,
+                         direction: _PumpDirectionOrLiteral) -> None:
+        """
+        Define the "dispense" rotation direction for a channel (see
+        :meth:`dispense_vol` and :meth:`aspirate_vol`).
+
+        Directions are normalized to :class:`PumpDirection` members on the
+        way in, so assign through this method rather than mutating
+        :attr:`dispense_dirs` directly.
+
+        :param ch_no: Pump channel number
+        :param direction: The rotation direction that dispenses on this
+            channel
+        """
+        self._assert_valid_ch_no(ch_no)
+        self.dispense_dirs[ch_no] = self.PumpDirection(direction)
+
     def stop(self, ch_no: Optional[int] = None) -> None:
         """
         Immediately stop pumping on the specified channel (or all channels).
@@ -461,11 +872,14 @@ class RegloIccPump:
             (see class descriptions)
         """
         if ch_no is None:
-            for ch_no_ in self.channel_nos:
-                self.stop(ch_no_)
-            return
-        self._assert_valid_ch_no(ch_no)
-        self._run_cmd(f"{ch_no}I{self.pump_addr}")  # stop!
+            ch_nos: Sequence[int] = self._channel_nos
+        else:
+            self._assert_valid_ch_no(ch_no)
+            ch_nos = (ch_no,)
+        for ch_no_ in ch_nos:
+            self._eta.pop(ch_no_, None)
+            self._run_cmd(self._stop_cmds[ch_no_])  # stop!
+            self._known_idle.add(ch_no_)
 
     def is_running(self, ch_no: int) -> bool:
         """
@@ -480,46 +894,141 @@ class RegloIccPump:
             (see class descriptions)
         """
         self._assert_valid_ch_no(ch_no)
-        result = self._run_cmd(
-            f"{ch_no}E{self.pump_addr}", check_success=False)
+        return self._is_running_unchecked(ch_no)
+
+    def _is_running_cached(self, ch_no: int) -> bool:
+        # Wait-loop variant of is_running: while well inside the
+        # flow-rate-derived ETA recorded when the operation was started,
+        # the channel is necessarily still running, so skip the wire query
+        # entirely. The public is_running never takes this shortcut.
+        eta = self._eta.get(ch_no)
+        if eta is not None and time.monotonic() < eta - 1.:
+            return True
+        running = self._is_running_unchecked(ch_no)
+        if not running:
+            self._eta.pop(ch_no, None)
+        return running
+
+    def _is_running_unchecked(self, ch_no: int) -> bool:
+        # Internal variant of is_running without channel number validation,
+        # for polling loops that already iterate over known-valid channels.
+        # Where the port exposes a real file descriptor, talk to the OS
+        # directly for the single status byte, bypassing pySerial's
+        # cross-platform read machinery on this highest-frequency command.
+        with self._io_lock:
+            self._prepare_to_send()
+            if self._ser_fd is not None:
+                os.write(self._ser_fd, self._is_running_cmds[ch_no])
+                rlist = select.select(
+                    [self._ser_fd], [], [], self.CMD_TIMEOUT_S)[0]
+                if not rlist:
+                    raise self.CommandTimeout()
+                resp = os.read(self._ser_fd, 1)
+                if not resp:
+                    raise self.CommandTimeout()
+                if resp[0] not in self._VALID_RESPS:
+                    raise self.InvalidResponse()
+                result = resp.decode("ascii")
+            else:
+                self.ser_port.write(self._is_running_cmds[ch_no])
+                result = self._read_cmd_resp(
+                    check_success=False, pass_resps="")
         answer = result == "+"
-        if answer:
-            last_odo = self._last_odo_val[ch_no]
-            self._last_odo_val[ch_no] = self._ask_odometer_val(ch_no)
+        if not answer:
+            self._known_idle.add(ch_no)
+        else:
             now = time.monotonic()
-            if self._last_odo_val[ch_no] != last_odo:
-                self._last_odo_val_tstamp[ch_no] = now
-            elif now - self._last_odo_val_tstamp[ch_no] >= 2:
-                self._on_stall_detection_detected(ch_no)
+            # With a 2 s stall window, sampling the odometer more often
+            # than every 0.5 s can't change the outcome -- skip the extra
+            # round trip on intermediate polls
+            if now - self._last_odo_read_tstamp[ch_no] \
+                    >= self.ODO_POLL_INTERVAL_S:
+                last_odo = self._last_odo_val[ch_no]
+                self._last_odo_val[ch_no] = self._ask_odometer_val(ch_no)
+                self._last_odo_read_tstamp[ch_no] = now
+                if self._last_odo_val[ch_no] != last_odo:
+                    self._last_odo_val_tstamp[ch_no] = now
+                elif now - self._last_odo_val_tstamp[ch_no] >= 2:
+                    self._on_stall_detection_detected(ch_no)
         return answer
 
-    def wait_for_stop(self, ch_no: Optional[int] = None) -> None:
+    def wait_for_stop(self, ch_no: Optional[int] = None,
+                      timeout: Optional[float] = None,
+                      poll_interval_s: Optional[float] = None) -> None:
         """
         Poll the status of a particular channel (or all channels) until
         pumping is complete.
 
-        :param ch_no: Channel number to check; if ``None``, check all channels
+        Polls are spaced out with a short (growing) sleep rather than issued
+        back to back, to avoid hogging the CPU and flooding the serial link
+        with status queries. When waiting on all channels, the channels are
+        polled round-robin so that completion of one channel is noticed even
+        while others are still running.
 
-        :raises CommandTimeout, InvalidResponse, RemoteError:
-            (see class descriptions)
+        :param ch_no: Channel number to check; if ``None``, check all channels
+        :param timeout: If not ``None``, maximum time to wait, in seconds;
+            :class:`CommandTimeout` is raised if any requested channel is
+            still running once this much time has elapsed. When waiting on
+            all channels the timeout is shared, not per-channel.
+        :param poll_interval_s: Initial interval between status polls, in
+            seconds; defaults to :attr:`POLL_INTERVAL_MIN_S`. Useful for
+            tightening completion latency on very short dispenses. The
+            interval still backs off toward :attr:`POLL_INTERVAL_MAX_S`
+            while waiting.
+
+        :raises CommandTimeout: if ``timeout`` was exceeded (or no response
+            was received to a status query)
+        :raises InvalidResponse, RemoteError: (see class descriptions)
         """
         if ch_no is None:
-            for ch_no_ in self.channel_nos:
-                self.wait_for_stop(ch_no_)
-            return
-        while self.is_running(ch_no):
-            pass
-
-    def show_msg(self, msg: str) -> None:
+            self._wait_for_stop_multi(
+                list(self._channel_nos), timeout, poll_interval_s)
+        else:
+            self._assert_valid_ch_no(ch_no)
+            self._wait_for_stop_multi([ch_no], timeout, poll_interval_s)
+
+    def _wait_for_stop_multi(self, ch_nos: List[int],
+                             timeout: Optional[float] = None,
+                             poll_interval_s: Optional[float] = None
+                             ) -> None:
+        deadline = (
+            time.monotonic() + timeout if timeout is not None else None)
+        pending = ch_nos
+        delay = (
+            poll_interval_s if poll_interval_s is not None
+            else self.POLL_INTERVAL_MIN_S)
+        while pending:
+            pending = [x for x in pending if self._is_running_cached(x)]
+            if not pending:
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise self.CommandTimeout(
+                    f"Channel(s) {pending!r} still running after "
+                    f"{timeout} s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, self.POLL_INTERVAL_MAX_S)
+
+    def show_msg(self, msg: str, wait_ack: bool = True) -> None:
         """
         Shows a message on the display, if present.
 
         :param msg: Text to display, up to 15 characters
+        :param wait_ack: If ``True`` (the default), wait for the pump to
+            acknowledge the command. If ``False``, return immediately after
+            queuing the command; the acknowledgement is collected (and any
+            error in it ignored) the next time a command is sent. Display
+            updates have no physical consequence, so this is a safe way to
+            avoid stalling a busy script for a cosmetic update.
 
         :raises CommandTimeout, InvalidResponse, RemoteError:
-            (see class descriptions)
+            (only if ``wait_ack`` -- see class descriptions)
         """
-        self._run_cmd(f"{self.pump_addr}DA{msg[:15]}")
+        if wait_ack:
+            self._run_cmd(f"{self.pump_addr}DA{msg[:15]}")
+        else:
+            with self._io_lock:
+                self._send_cmd(f"{self.pump_addr}DA{msg[:15]}")
+                self._acks_owed += 1
 
     @property
     def pump_addr(self) -> int:
@@ -531,36 +1040,48 @@ class RegloIccPump:
         """List of valid channel numbers"""
         return list(self._channel_nos)
 
+    def _fetch_pump_info(self) -> None:
+        self._pump_model_no, self._pump_sw_ver, self._pump_head_code = \
+            self._ask_pump_info()
+
     @property
     def model_no(self) -> str:
-        """Model number reported by the pump"""
+        """Model number reported by the pump (queried on first access)"""
+        if self._pump_model_no is None:
+            self._fetch_pump_info()
         return self._pump_model_no
 
     @property
     def serial_no(self) -> str:
-        """Serial number reported by the pump"""
+        """Serial number reported by the pump (queried on first access)"""
+        if self._pump_serial_no is None:
+            self._pump_serial_no = self._ask_serial_no()
         return self._pump_serial_no
 
     @property
     def sw_ver(self) -> str:
-        """Software version reported by the pump"""
+        """Software version reported by the pump (queried on first access)"""
+        if self._pump_sw_ver is None:
+            self._fetch_pump_info()
         return self._pump_sw_ver
 
     @property
     def head_code(self) -> str:
-        """Pump head code reported by the pump"""
+        """Pump head code reported by the pump (queried on first access)"""
+        if self._pump_head_code is None:
+            self._fetch_pump_info()
         return self._pump_head_code
 
     @staticmethod
     def _format_vol_type2(vol: float) -> str:
-        left, right = f"{vol:.3e}".rsplit("e", 1)
-        m_str = "".join(left.split("."))
-        exp = int(right)
-        return f"{m_str}{exp:+1d}"
-
-    @staticmethod
-    def _format_discrete_type2(vol: float) -> str:
-        left, right = f"{vol:.3e}".rsplit("e", 1)
-        m_str = "".join(left.split("."))
-        exp = int(right)
-        return f"{m_str}{exp:+1d}"
+        if vol == 0.:
+            return "0000+0"
+        exp = int(math.floor(math.log10(abs(vol))))
+        mant = int(round(abs(vol) * 10.**(3 - exp)))
+        if mant >= 10000:  # rounding pushed the mantissa to 5 digits
+            mant //= 10
+            exp += 1
+        sign = "-" if vol < 0. else ""
+        return f"{sign}{mant:04d}{exp:+1d}"
+
+    _format_discrete_type2 = _format_vol_type2
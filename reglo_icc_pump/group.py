@@ -0,0 +1,77 @@
+from concurrent import futures
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._driver import RegloIccPump
+
+
+class PumpGroup:
+    """
+    Convenience helper for driving several pumps (each on its own serial
+    port) concurrently from one caller.
+
+    Each operation is fanned out to the pumps via a thread pool. Since the
+    pumps live on separate serial ports and each :class:`RegloIccPump`
+    serializes access to its own port internally, the per-pump I/O proceeds
+    truly in parallel and a group-wide operation takes roughly as long as
+    the slowest single pump rather than the sum over all of them.
+    """
+
+    def __init__(self, pumps: Iterable[RegloIccPump]):
+        """
+        :param pumps: The :class:`RegloIccPump` instances to operate on
+        """
+        self.pumps: List[RegloIccPump] = list(pumps)
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max(len(self.pumps), 1))
+
+    def dispense_vol(
+            self,
+            dispatch: Dict[RegloIccPump, Tuple[int, float, float]]
+            ) -> None:
+        """
+        Run :meth:`RegloIccPump.dispense_vol` on several pumps in parallel,
+        returning once all of them have finished.
+
+        :param dispatch: Mapping of pump instances to ``(ch_no, vol, rate)``
+            tuples with the same meaning as the corresponding
+            :meth:`RegloIccPump.dispense_vol` parameters
+
+        :raises: whatever the underlying :meth:`RegloIccPump.dispense_vol`
+            calls raise; if several fail, the first failure (in ``dispatch``
+            order) is re-raised after all calls have completed
+        """
+        self._fan_out([
+            (pump.dispense_vol, args) for pump, args in dispatch.items()])
+
+    def aspirate_vol(
+            self,
+            dispatch: Dict[RegloIccPump, Tuple[int, float, float]]
+            ) -> None:
+        """
+        Like :meth:`dispense_vol`, but runs
+        :meth:`RegloIccPump.aspirate_vol` on each pump.
+        """
+        self._fan_out([
+            (pump.aspirate_vol, args) for pump, args in dispatch.items()])
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait (in parallel) until all channels of all pumps in the group have
+        stopped.
+
+        :param timeout: Per-pump wait timeout, in seconds (see
+            :meth:`RegloIccPump.wait_for_stop`)
+        """
+        self._fan_out([
+            (pump.wait_for_stop, (None, timeout)) for pump in self.pumps])
+
+    def stop(self) -> None:
+        """Stop all channels of all pumps in the group."""
+        self._fan_out([(pump.stop, ()) for pump in self.pumps])
+
+    def _fan_out(self, calls) -> None:
+        futs = [
+            self._executor.submit(fn, *args) for fn, args in calls]
+        futures.wait(futs)
+        for fut in futs:
+            fut.result()
@@ -1,46 +1,58 @@
-from enum import Enum
+import sys
+from typing import final
 
 
+# All exceptions declare empty __slots__: they carry no state beyond the
+# base Exception's args, and skipping the per-instance __dict__ makes
+# raising them cheaper in the retry/timeout loops where they fire most.
+
 class RegloIccPumpError(Exception):
     """Superclass of all RegloIccPump errors"""
-    pass
+    __slots__ = ()
 
 
+@final
 class DeviceNotFound(RegloIccPumpError):
     """
     No USB-connected pumps detected, or none matching the specified criteria
     """
-    pass
+    __slots__ = ()
 
 
+@final
 class SerialNoMismatch(RegloIccPumpError):
     """
     The serial number reported by the pump doesn't match what was expected
     """
-    pass
+    __slots__ = ()
 
 
+@final
 class CommandTimeout(RegloIccPumpError):
     """No response was received to a command"""
-    pass
+    __slots__ = ()
 
 
+@final
 class InvalidResponse(RegloIccPumpError):
     """Data received from the pump did not match expectations"""
-    pass
+    __slots__ = ()
 
 
+@final
 class RemoteError(RegloIccPumpError):
     """The pump responded to a command with an error"""
-    pass
+    __slots__ = ()
 
 
+@final
 class StallDetectionDetected(RegloIccPumpError):
     """
     The pump reports that the channel is still running but its time counter is
     no longer counting up. This likely means the half baked stall detection
     feature apparently introduced in firmware V204 has triggered.
     """
+    __slots__ = ()
 
 
 class InvalidParameter(RegloIccPumpError):
@@ -48,37 +60,104 @@ class InvalidParameter(RegloIccPumpError):
     The pump reported (or the driver caught proactively) that a supplied
     parameter for a pump command is out of range or otherwise invalid
     """
+    __slots__ = ()
 
 
+@final
 class InvalidTubingId(InvalidParameter):
     """
     The specified tubing inner diameter is not one of the acceptable values
     """
-    pass
+    __slots__ = ()
 
 
+@final
 class InvalidFlowRate(InvalidParameter):
     """The requested flow rate is out of range"""
-    pass
+    __slots__ = ()
 
 
+@final
 class InvalidVolume(InvalidParameter):
     """The requested volume is out of range"""
-    pass
+    __slots__ = ()
+
 
+class PumpDirection:
+    """
+    Pump rotor rotation direction, as viewed from the front.
+
+    Behaves like a two-member enum -- ``PumpDirection.CW`` /
+    ``PumpDirection.CCW`` are singletons, ``PumpDirection("cw")`` maps a
+    value back to its member and members have a ``value`` attribute -- but
+    is a plain class, so member access and comparisons are ordinary
+    attribute loads and identity checks without ``EnumMeta``'s descriptor
+    overhead on the per-command paths that pass directions around.
+    """
 
-class PumpDirection(Enum):
-    """Pump rotor rotation direction, as viewed from the front"""
+    __slots__ = ('value', '_opp')
+    __match_args__ = ('value',)
 
     #: Clockwise
-    CW = "cw"
+    CW: 'PumpDirection'
 
     #: Counter-clockwise
-    CCW = "ccw"
+    CCW: 'PumpDirection'
+
+    #: The direction's string value ("cw" or "ccw")
+    value: str
+
+    def __new__(cls, value) -> 'PumpDirection':
+        # By-value lookup, mirroring Enum semantics: returns the existing
+        # member for its value (members themselves pass through unchanged)
+        try:
+            return _MEMBERS[value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"{value!r} is not a valid PumpDirection") from None
+
+    def __repr__(self) -> str:
+        return f"<PumpDirection.{self.value.upper()}: {self.value!r}>"
+
+    @classmethod
+    def from_str(cls, s: str) -> 'PumpDirection':
+        """
+        Map a direction string (``"cw"``/``"ccw"``) straight to its member.
+
+        Fastest path for deserializing known-good direction strings: a bare
+        dict lookup, skipping the ``__new__`` call and its error handling.
+        Unknown strings raise :class:`KeyError`; use ``PumpDirection(s)``
+        where a :class:`ValueError` with a friendly message is wanted.
+        """
+        return _MEMBERS[s]
 
     def opposite(self) -> 'PumpDirection':
         """Return the opposite direction"""
-        return (
-            PumpDirection.CW if self == PumpDirection.CCW
-            else PumpDirection.CCW
-            )
+        return self._opp
+
+
+def _make_direction(value: str) -> PumpDirection:
+    member = object.__new__(PumpDirection)
+    # Interned so equality tests against other interned "cw"/"ccw" strings
+    # short-circuit on pointer identity
+    member.value = sys.intern(value)
+    return member
+
+
+PumpDirection.CW = _make_direction("cw")
+PumpDirection.CCW = _make_direction("ccw")
+PumpDirection.CW._opp = PumpDirection.CCW
+PumpDirection.CCW._opp = PumpDirection.CW
+
+# Member keys make PumpDirection(member) a pass-through via the same lookup
+_MEMBERS = {
+    "cw": PumpDirection.CW,
+    "ccw": PumpDirection.CCW,
+    PumpDirection.CW: PumpDirection.CW,
+    PumpDirection.CCW: PumpDirection.CCW,
+    }
+
+#: Module-level aliases for the members, for call sites that want a single
+#: global load instead of the class-attribute chain
+CW = PumpDirection.CW
+CCW = PumpDirection.CCW